@@ -1,24 +1,60 @@
 """Histogram API endpoint."""
 
-import base64
+import binascii
 import time
+from io import BytesIO
 
+import anyio
 from fastapi import APIRouter, File, Form, HTTPException, UploadFile
 
 from app.core.config import settings
 from app.schemas.histogram import HistogramMetadata, HistogramResponse
 from app.services.histogram import calculate_histogram
-from app.services.renderer import render_histogram
+from app.services.renderer import create_renderer
 
 router = APIRouter()
 
+# Upload read size (1MB)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Request constraints, resolved once at import instead of per request
+SUPPORTED_FORMATS = frozenset(settings.supported_formats)
+AVAILABLE_STYLES = frozenset(settings.available_styles)
+AVAILABLE_ASPECT_RATIOS = frozenset(settings.available_aspect_ratios)
+MAX_UPLOAD_BYTES = settings.max_file_size_mb * 1024 * 1024
+
+# Caps concurrent CPU-bound work separately from the default threadpool,
+# which FastAPI also uses for upload I/O. Network waits such as the OpenRouter
+# round-trip run on the default threadpool so they never hold a render slot.
+_render_limiter = anyio.CapacityLimiter(settings.max_render_workers)
+
+# Error responses for form fields whose bounds are enforced by FastAPI.
+# Returned as 400 with the same shape as the handler's own errors.
+FORM_FIELD_ERRORS: dict[str, dict[str, str]] = {
+    "width": {
+        "error": "INVALID_WIDTH",
+        "message": f"Width must be between 100 and {settings.max_output_width} pixels.",
+    },
+    "smoothing": {
+        "error": "INVALID_SMOOTHING",
+        "message": "Smoothing must be between 0.0 and 1.0.",
+    },
+}
+
 
 @router.post("/histogram", response_model=HistogramResponse)
 async def create_histogram(
     image: UploadFile = File(..., description="Source image file (JPEG, PNG, WebP, TIFF)"),
     style: str = Form(default=settings.default_style, description="Visual style preset"),
-    width: int = Form(default=settings.default_output_width, description="Output width in pixels"),
-    smoothing: float = Form(default=settings.default_smoothing, description="Curve smoothing 0.0-1.0"),
+    width: int = Form(
+        default=settings.default_output_width,
+        ge=100,
+        le=settings.max_output_width,
+        description="Output width in pixels",
+    ),
+    smoothing: float = Form(
+        default=settings.default_smoothing, ge=0.0, le=1.0, description="Curve smoothing 0.0-1.0"
+    ),
     aspect_ratio: float = Form(default=settings.default_aspect_ratio, description="Output aspect ratio (width/height)"),
 ):
     """
@@ -29,7 +65,7 @@ async def create_histogram(
     start_time = time.time()
 
     # Validate content type
-    if image.content_type not in settings.supported_formats:
+    if image.content_type not in SUPPORTED_FORMATS:
         raise HTTPException(
             status_code=400,
             detail={
@@ -40,7 +76,7 @@ async def create_histogram(
         )
 
     # Validate style
-    if style not in settings.available_styles:
+    if style not in AVAILABLE_STYLES:
         raise HTTPException(
             status_code=400,
             detail={
@@ -50,28 +86,8 @@ async def create_histogram(
             },
         )
 
-    # Validate width
-    if width < 100 or width > settings.max_output_width:
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error": "INVALID_WIDTH",
-                "message": f"Width must be between 100 and {settings.max_output_width} pixels.",
-            },
-        )
-
-    # Validate smoothing
-    if smoothing < 0.0 or smoothing > 1.0:
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error": "INVALID_SMOOTHING",
-                "message": "Smoothing must be between 0.0 and 1.0.",
-            },
-        )
-
     # Validate aspect_ratio
-    if aspect_ratio not in settings.available_aspect_ratios:
+    if aspect_ratio not in AVAILABLE_ASPECT_RATIOS:
         raise HTTPException(
             status_code=400,
             detail={
@@ -81,35 +97,48 @@ async def create_histogram(
             },
         )
 
-    # Read image bytes
-    image_bytes = await image.read()
+    # Read image bytes in chunks, rejecting oversized uploads as soon as the
+    # limit is crossed so an oversized file is never copied into memory
+    buf = BytesIO()
+    while chunk := await image.read(UPLOAD_CHUNK_SIZE):
+        if buf.tell() + len(chunk) > MAX_UPLOAD_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail={
+                    "error": "IMAGE_TOO_LARGE",
+                    "message": f"Image exceeds maximum size of {settings.max_file_size_mb}MB.",
+                },
+            )
+        buf.write(chunk)
+    image_bytes = buf.getvalue()
 
-    # Check file size
-    max_size_bytes = settings.max_file_size_mb * 1024 * 1024
-    if len(image_bytes) > max_size_bytes:
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error": "IMAGE_TOO_LARGE",
-                "message": f"Image exceeds maximum size of {settings.max_file_size_mb}MB.",
-            },
+    try:
+        # Calculate histogram and render off the event loop; NumPy, Pillow
+        # and Agg release the GIL so requests render in parallel
+        histogram_data = await anyio.to_thread.run_sync(
+            calculate_histogram, image_bytes, limiter=_render_limiter
         )
 
-    try:
-        # Calculate histogram
-        histogram_data = calculate_histogram(image_bytes)
-
-        # Render visualization
-        result = render_histogram(
-            data=histogram_data,
-            style=style,
-            width=width,
-            smoothing=smoothing,
-            aspect_ratio=aspect_ratio,
+        # Render visualization, trying the style's remote render first. Only
+        # building its input is CPU-bound; the request itself waits outside
+        # the render limiter.
+        renderer = create_renderer(
+            style, width=width, smoothing=smoothing, aspect_ratio=aspect_ratio
         )
+        result = None
+        if renderer.REMOTE_RENDER:
+            remote_input = await anyio.to_thread.run_sync(
+                renderer.remote_input, histogram_data, limiter=_render_limiter
+            )
+            if remote_input is not None:
+                result = await anyio.to_thread.run_sync(renderer.render_remote, remote_input)
+        if result is None:
+            result = await anyio.to_thread.run_sync(
+                renderer.render, histogram_data, limiter=_render_limiter
+            )
 
         # Encode to base64
-        image_base64 = base64.b64encode(result.image_bytes).decode("utf-8")
+        image_base64 = binascii.b2a_base64(result.image_bytes, newline=False).decode("ascii")
 
         # Calculate processing time
         processing_time_ms = int((time.time() - start_time) * 1000)
@@ -23,6 +23,9 @@ class Settings(BaseModel):
     available_styles: set[str] = {"elegant_curves", "minimal", "neon_glow", "original", "tron", "watercolor"}
     default_style: str = "elegant_curves"
 
+    # Concurrent histogram renders (CPU-bound, run in worker threads)
+    max_render_workers: int = os.cpu_count() or 1
+
     # Rendering defaults
     default_smoothing: float = 0.7
     default_aspect_ratio: float = 1.618  # Golden ratio
@@ -3,10 +3,12 @@
 from pathlib import Path
 
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.exception_handlers import request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
 
 load_dotenv()
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.api.v1 import histogram
@@ -20,6 +22,30 @@ app = FastAPI(
 
 app.include_router(histogram.router, prefix="/api/v1", tags=["histogram"])
 
+
+# Pydantic error types raised by the ge/le bounds on the histogram form fields
+RANGE_ERROR_TYPES = {"greater_than_equal", "less_than_equal"}
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    """Report out-of-range histogram form fields with the API's 400 error format."""
+    route = request.scope.get("route")
+    errors = exc.errors()
+    if getattr(route, "endpoint", None) is histogram.create_histogram and all(
+        len(error["loc"]) == 2
+        and error["loc"][0] == "body"
+        and error["loc"][1] in histogram.FORM_FIELD_ERRORS
+        and error["type"] in RANGE_ERROR_TYPES
+        for error in errors
+    ):
+        field = errors[0]["loc"][1]
+        return JSONResponse(
+            status_code=400, content={"detail": histogram.FORM_FIELD_ERRORS[field]}
+        )
+    return await request_validation_exception_handler(request, exc)
+
+
 # Serve static files
 static_dir = Path(__file__).parent / "static"
 app.mount("/static", StaticFiles(directory=static_dir), name="static")
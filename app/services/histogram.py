@@ -1,12 +1,20 @@
 """Core histogram calculation service."""
 
-from collections import Counter
 from dataclasses import dataclass
 from io import BytesIO
 
 import numpy as np
 from PIL import Image
 
+# Approximate pixel budget for histogram counting on large images
+HISTOGRAM_SAMPLE_PIXELS = 1_000_000
+
+# Longest side of the thumbnail used for dominant color extraction
+DOMINANT_COLOR_MAX_SIZE = 100
+
+# Two-digit uppercase hex for every channel value
+_HEX = [f"{i:02X}" for i in range(256)]
+
 
 @dataclass
 class HistogramData:
@@ -30,27 +38,60 @@ def calculate_histogram(image_bytes: bytes) -> HistogramData:
     """
     image = Image.open(BytesIO(image_bytes))
 
-    # Convert to RGB if necessary (handles RGBA, grayscale, etc.)
+    # Convert to RGB if necessary (handles RGBA, grayscale, etc.), closing
+    # the decoded source right away so only one full-size buffer is resident
     if image.mode != "RGB":
-        image = image.convert("RGB")
+        rgb_image = image.convert("RGB")
+        image.close()
+        image = rgb_image
+
+    return _calculate_from_image(image)
+
 
-    # Convert to numpy array
-    img_array = np.array(image)
+def calculate_histogram_array(img_array: np.ndarray) -> HistogramData:
+    """
+    Calculate RGB histogram from an already decoded pixel array.
 
-    # Calculate histogram for each channel (256 bins, values 0-255)
-    red_hist, _ = np.histogram(img_array[:, :, 0].flatten(), bins=256, range=(0, 256))
-    green_hist, _ = np.histogram(img_array[:, :, 1].flatten(), bins=256, range=(0, 256))
-    blue_hist, _ = np.histogram(img_array[:, :, 2].flatten(), bins=256, range=(0, 256))
+    Args:
+        img_array: Numpy uint8 array of RGB image, shape (height, width, 3)
+
+    Returns:
+        HistogramData containing histogram arrays and dominant colors
+    """
+    return _calculate_from_image(Image.fromarray(img_array, "RGB"))
+
+
+def _calculate_from_image(image: Image.Image) -> HistogramData:
+    """Compute histograms and dominant colors of an RGB image, then close it."""
+    # Sample every k-th pixel of very large images; the pass is memory-bound.
+    # At a million samples the normalized shape stays close to the full count,
+    # though point sampling can alias on smooth gradients and fine periodic
+    # detail. A NEAREST resize is a point sample done in C without copying.
+    stride = max(1, int(np.sqrt(image.width * image.height / HISTOGRAM_SAMPLE_PIXELS)))
+    sampled = image
+    if stride > 1:
+        sampled = image.resize(
+            (image.width // stride, image.height // stride), Image.Resampling.NEAREST
+        )
+
+    # Calculate histogram for each channel (256 bins, values 0-255).
+    # Pillow counts all three channels in C over its own pixel buffer.
+    hist = np.asarray(sampled.histogram(), dtype=np.float32).reshape(3, 256)
+    if sampled is not image:
+        sampled.close()
 
     # Normalize histograms to 0-1 range
-    max_val = max(red_hist.max(), green_hist.max(), blue_hist.max())
+    max_val = hist.max()
     if max_val > 0:
-        red_hist = red_hist.astype(float) / max_val
-        green_hist = green_hist.astype(float) / max_val
-        blue_hist = blue_hist.astype(float) / max_val
+        hist *= 1.0 / max_val
+    red_hist, green_hist, blue_hist = hist
 
-    # Extract dominant colors
-    dominant_colors = extract_dominant_colors(img_array, n_colors=5)
+    # Extract dominant colors from a thumbnail taken straight from the PIL image,
+    # then release the full-size pixel buffer before the render phase
+    thumbnail = _downscale_for_colors(image)
+    thumbnail_array = np.asarray(thumbnail)
+    image.close()
+    dominant_colors = extract_dominant_colors(thumbnail_array, n_colors=5)
 
     return HistogramData(
         red=red_hist,
@@ -72,29 +113,49 @@ def extract_dominant_colors(img_array: np.ndarray, n_colors: int = 5) -> list[st
         List of hex color strings
     """
     # Resize image for faster processing
-    h, w = img_array.shape[:2]
-    scale = min(1.0, 100 / max(h, w))
-    if scale < 1.0:
-        new_h, new_w = int(h * scale), int(w * scale)
-        img_small = Image.fromarray(img_array).resize((new_w, new_h), Image.Resampling.LANCZOS)
-        img_array = np.array(img_small)
+    if max(img_array.shape[:2]) > DOMINANT_COLOR_MAX_SIZE:
+        img_array = np.asarray(_downscale_for_colors(Image.fromarray(img_array)))
 
     # Flatten to list of pixels and quantize to reduce color space
     pixels = img_array.reshape(-1, 3)
-    # Quantize to 32 levels per channel for faster counting
-    quantized = (pixels // 8) * 8
+    # Quantize to 32 levels per channel for faster counting (clear the low 3 bits)
+    quantized = pixels & np.uint8(0xF8)
+
+    # Pack each pixel into a single 24-bit key and count colors in C. One
+    # transposing copy yields contiguous uint32 planes instead of three
+    # strided column casts.
+    red, green, blue = np.ascontiguousarray(quantized.T, dtype=np.uint32)
+    keys = red | (green << 8) | (blue << 16)
+    values, first_seen, counts = np.unique(keys, return_index=True, return_counts=True)
+
+    # Get most common colors, breaking ties by first occurrence. A single
+    # unique rank per color lets argpartition select the top-k in O(N).
+    rank = -counts.astype(np.int64) * keys.size + first_seen
+    if n_colors < rank.size:
+        idx = np.argpartition(rank, n_colors)[:n_colors]
+    else:
+        idx = np.arange(rank.size)
+    top = values[idx[np.argsort(rank[idx])]]
+
+    # Unpack keys and convert to hex
+    hex_colors = []
+    for key in top.tolist():
+        r, g, b = key & 0xFF, (key >> 8) & 0xFF, (key >> 16) & 0xFF
+        hex_colors.append(f"#{_HEX[r]}{_HEX[g]}{_HEX[b]}")
 
-    # Count colors
-    color_tuples = [tuple(p) for p in quantized]
-    color_counts = Counter(color_tuples)
+    return hex_colors
 
-    # Get most common colors
-    most_common = color_counts.most_common(n_colors)
 
-    # Convert to hex
-    hex_colors = []
-    for color, _ in most_common:
-        r, g, b = color
-        hex_colors.append(f"#{r:02X}{g:02X}{b:02X}")
+def _downscale_for_colors(image: Image.Image) -> Image.Image:
+    """
+    Shrink an image so its longest side is at most DOMINANT_COLOR_MAX_SIZE.
 
-    return hex_colors
+    Uses bilinear resampling: the result is quantized to 32 levels per channel,
+    so a wide filter like LANCZOS buys nothing for color counting.
+    """
+    scale = min(1.0, DOMINANT_COLOR_MAX_SIZE / max(image.size))
+    if scale < 1.0:
+        new_w = max(1, int(image.width * scale))
+        new_h = max(1, int(image.height * scale))
+        image = image.resize((new_w, new_h), Image.Resampling.BILINEAR)
+    return image
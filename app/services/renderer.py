@@ -1,7 +1,6 @@
 """Renderer service for histogram visualization."""
 
-from app.services.histogram import HistogramData
-from app.styles.base import BaseStyle, RenderResult
+from app.styles.base import BaseStyle
 from app.styles.elegant_curves import ElegantCurvesStyle
 from app.styles.minimal import MinimalStyle
 from app.styles.neon_glow import NeonGlowStyle
@@ -25,25 +24,23 @@ def get_available_styles() -> list[str]:
     return list(STYLE_REGISTRY.keys())
 
 
-def render_histogram(
-    data: HistogramData,
+def create_renderer(
     style: str = "elegant_curves",
     width: int = 1200,
     smoothing: float = 0.7,
     aspect_ratio: float = 1.618,
-) -> RenderResult:
+) -> BaseStyle:
     """
-    Render histogram data using the specified style.
+    Create the style renderer for the given parameters.
 
     Args:
-        data: Histogram data to visualize
         style: Style preset name
         width: Output width in pixels
         smoothing: Curve smoothing factor 0.0-1.0
         aspect_ratio: Width-to-height ratio for output image
 
     Returns:
-        RenderResult containing PNG bytes and dimensions
+        Style instance ready to render
 
     Raises:
         ValueError: If style is not recognized
@@ -52,6 +49,5 @@ def render_histogram(
         raise ValueError(f"Unknown style: {style}. Available: {list(STYLE_REGISTRY.keys())}")
 
     style_class = STYLE_REGISTRY[style]
-    renderer = style_class(width=width, smoothing=smoothing, aspect_ratio=aspect_ratio)
+    return style_class(width=width, smoothing=smoothing, aspect_ratio=aspect_ratio)
 
-    return renderer.render(data)
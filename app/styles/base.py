@@ -1,17 +1,69 @@
 """Base class for histogram visualization styles."""
 
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from io import BytesIO
 
-import matplotlib
-matplotlib.use("Agg")  # Use non-GUI backend for server use
-import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure, SubplotParams
+from matplotlib.patches import Polygon
+from PIL import Image
 from scipy.ndimage import gaussian_filter1d
 
 from app.services.histogram import HistogramData
 
+# Pillow PNG encoder options. Encoding dominates render time; zlib level 3
+# is about as fast as level 1 on plot images and compresses noticeably better.
+PNG_SAVE_OPTIONS = {"compress_level": 3, "optimize": False}
+
+# Idle figures kept per worker thread, keyed by pixel size and DPI. Reusing a
+# figure skips canvas, renderer and transform setup on every request.
+FIGURE_POOL_SIZE = 4
+_figure_pool = threading.local()
+
+
+def _idle_figures() -> OrderedDict[tuple[int, int, int], Figure]:
+    """Get this thread's pool of idle figures, least recently used first."""
+    if not hasattr(_figure_pool, "figures"):
+        _figure_pool.figures = OrderedDict()
+    return _figure_pool.figures
+
+
+# X values for the 256 histogram bins, shared read-only by every style
+HISTOGRAM_X = np.linspace(0, 255, 256, dtype=np.float32)
+HISTOGRAM_X.flags.writeable = False
+
+# Smoothed channel sets kept for reuse when the same histogram is rendered
+# again, e.g. in several styles or as the watercolor reference image
+SMOOTHED_CACHE_SIZE = 32
+
+
+def _smooth(hist: np.ndarray, smoothing: float) -> np.ndarray:
+    """Apply Gaussian smoothing along the last axis for a 0-1 smoothing factor."""
+    if smoothing <= 0:
+        return hist
+    # sigma scales with smoothing factor (0-1 maps to 0-10 sigma)
+    return gaussian_filter1d(hist, sigma=smoothing * 10, axis=-1)
+
+
+@lru_cache(maxsize=SMOOTHED_CACHE_SIZE)
+def _smoothed_normalized(channels: bytes, smoothing: float) -> tuple[np.ndarray, ...]:
+    """Smooth and normalize packed float32 channels; results are read-only."""
+    stacked = _smooth(np.frombuffer(channels, dtype=np.float32).reshape(3, -1), smoothing)
+    max_val = stacked.max()
+    if max_val > 0:
+        stacked = stacked / max_val
+    else:
+        stacked = stacked.copy()
+    stacked.flags.writeable = False
+    return tuple(stacked)
+
 
 @dataclass
 class RenderResult:
@@ -48,20 +100,79 @@ class BaseStyle(ABC):
         # DPI for matplotlib (100 DPI means width in pixels = figsize * 100)
         self.dpi = 100
 
-    def smooth_histogram(self, hist: np.ndarray) -> np.ndarray:
-        """Apply Gaussian smoothing to histogram data."""
-        if self.smoothing <= 0:
-            return hist
-        # sigma scales with smoothing factor (0-1 maps to 0-10 sigma)
-        sigma = self.smoothing * 10
-        return gaussian_filter1d(hist, sigma=sigma)
-
-    def normalize_to_full_range(self, *histograms: np.ndarray) -> list[np.ndarray]:
-        """Normalize histograms so the max value across all reaches 1.0."""
-        max_val = max(h.max() for h in histograms)
-        if max_val > 0:
-            return [h / max_val for h in histograms]
-        return list(histograms)
+    def smooth_and_normalize(self, data: HistogramData) -> tuple[np.ndarray, ...]:
+        """
+        Smooth all three channels in one filter pass, then normalize to full range.
+
+        Results are cached by histogram content and smoothing, and returned as
+        read-only float32 arrays shared between callers.
+        """
+        stacked = np.vstack([data.red, data.green, data.blue], dtype=np.float32)
+        return _smoothed_normalized(stacked.tobytes(), self.smoothing)
+
+    def _create_figure(self, facecolor: str = "none") -> tuple[Figure, Axes]:
+        """
+        Create a figure and axes sized to the output dimensions.
+
+        Attaches an Agg canvas directly instead of going through pyplot, whose
+        global figure manager is not thread-safe under concurrent requests.
+        Figures come from a per-thread pool together with their (cleared)
+        axes; hand them back with _release_figure() once saved.
+        """
+        key = (self.width, self.height, self.dpi)
+        fig = _idle_figures().pop(key, None)
+        if fig is None:
+            fig = Figure(figsize=(self.width / self.dpi, self.height / self.dpi), dpi=self.dpi)
+            FigureCanvasAgg(fig)
+            fig.add_subplot()
+        ax = fig.axes[0]
+        # Pooled figures keep the previous render's margins; start from defaults
+        fig.subplots_adjust(**vars(SubplotParams()))
+        fig.set_facecolor(facecolor)
+        ax.set_facecolor(facecolor)
+        return fig, ax
+
+    def _release_figure(self, fig: Figure):
+        """Clear a saved figure's axes and return it to this thread's pool."""
+        # Clearing the axes in place is cheaper than fig.clear() followed by a
+        # fresh add_subplot(), which rebuilds the axis and tick machinery
+        fig.axes[0].clear()
+        # Pooled figures must not carry draw state into the next render: a
+        # reused RendererAgg caches clip masks by path id(), so a new clip path
+        # at a recycled address would pick up a stale mask. A fresh canvas has
+        # no renderer until the next draw, which also frees the pixel buffer.
+        FigureCanvasAgg(fig)
+        figures = _idle_figures()
+        figures[(self.width, self.height, self.dpi)] = fig
+        while len(figures) > FIGURE_POOL_SIZE:
+            figures.popitem(last=False)
+
+    def _clip_to_curve(self, ax: Axes, artist: Artist, x: np.ndarray, y: np.ndarray):
+        """Clip an artist to the area between a curve and the baseline."""
+        # Build polygon: curve points + bottom corners, as one (N + 2, 2) array
+        n = len(x)
+        verts = np.empty((n + 2, 2))
+        verts[:n, 0] = x
+        verts[:n, 1] = y
+        verts[n] = (x[-1], 0)  # Bottom right
+        verts[n + 1] = (x[0], 0)  # Bottom left
+        artist.set_clip_path(Polygon(verts, closed=True, transform=ax.transData))
+
+    # Whether the style can produce its image remotely via render_remote()
+    REMOTE_RENDER = False
+
+    def remote_input(self, data: HistogramData) -> bytes | None:
+        """
+        Build the input image for a remote render, or None to render locally.
+
+        This is CPU-bound work; the network round-trip happens separately in
+        render_remote(), so callers can keep it out of their CPU limits.
+        """
+        return None
+
+    def render_remote(self, input_bytes: bytes) -> RenderResult | None:
+        """Render remotely from remote_input() bytes; None falls back to render()."""
+        return None
 
     @abstractmethod
     def render(self, data: HistogramData) -> RenderResult:
@@ -76,10 +187,19 @@ class BaseStyle(ABC):
         """
         pass
 
-    def _save_figure_to_bytes(self, fig: plt.Figure) -> bytes:
-        """Save matplotlib figure to PNG bytes."""
+    def _encode_png(self, rgba: np.ndarray) -> bytes:
+        """
+        Encode an RGBA pixel buffer as PNG bytes.
+
+        Single entry point for PNG output, so encoder changes land in one place.
+        """
         buf = BytesIO()
-        fig.savefig(buf, format="png", dpi=self.dpi, bbox_inches="tight", pad_inches=0.1)
-        buf.seek(0)
-        plt.close(fig)
-        return buf.read()
+        Image.fromarray(rgba, "RGBA").save(buf, format="PNG", **PNG_SAVE_OPTIONS)
+        return buf.getvalue()
+
+    def _save_figure_to_bytes(self, fig: Figure) -> bytes:
+        """Save matplotlib figure to PNG bytes, keeping its alpha channel."""
+        fig.canvas.draw()
+        image_bytes = self._encode_png(np.asarray(fig.canvas.buffer_rgba()))
+        self._release_figure(fig)
+        return image_bytes
@@ -1,13 +1,22 @@
 """Elegant curves histogram style - smooth curves with rich vertical gradients."""
 
-from io import BytesIO
-
-import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.axes import Axes
 from matplotlib.colors import LinearSegmentedColormap
 
 from app.services.histogram import HistogramData
-from app.styles.base import BaseStyle, RenderResult
+from app.styles.base import HISTOGRAM_X, BaseStyle, RenderResult
+
+# Channel colormaps (dark to light), built once at import
+_RED_CMAP = LinearSegmentedColormap.from_list("red", [BaseStyle.RED_DARK, BaseStyle.RED_LIGHT])
+_GREEN_CMAP = LinearSegmentedColormap.from_list(
+    "green", [BaseStyle.GREEN_DARK, BaseStyle.GREEN_LIGHT]
+)
+_BLUE_CMAP = LinearSegmentedColormap.from_list("blue", [BaseStyle.BLUE_DARK, BaseStyle.BLUE_LIGHT])
+
+# Vertical gradient from dark (bottom) to light (top). A single column is
+# enough: imshow stretches it across the axes with aspect="auto".
+_GRADIENT = np.linspace(0, 1, 256, dtype=np.float32).reshape(-1, 1)
 
 
 class ElegantCurvesStyle(BaseStyle):
@@ -24,26 +33,18 @@ class ElegantCurvesStyle(BaseStyle):
     def render(self, data: HistogramData) -> RenderResult:
         """Render histogram with elegant curves style."""
         # Create figure with golden ratio dimensions
-        fig_width = self.width / self.dpi
-        fig_height = self.height / self.dpi
-        fig, ax = plt.subplots(figsize=(fig_width, fig_height), facecolor="none")
-        ax.set_facecolor("none")
+        fig, ax = self._create_figure()
 
         # X values (0-255 for histogram bins)
-        x = np.linspace(0, 255, 256)
+        x = HISTOGRAM_X
 
         # Smooth the histograms and normalize to use full vertical range
-        red_smooth = self.smooth_histogram(data.red)
-        green_smooth = self.smooth_histogram(data.green)
-        blue_smooth = self.smooth_histogram(data.blue)
-        red_smooth, green_smooth, blue_smooth = self.normalize_to_full_range(
-            red_smooth, green_smooth, blue_smooth
-        )
+        red_smooth, green_smooth, blue_smooth = self.smooth_and_normalize(data)
 
         # Draw gradient fills for each channel
-        self._draw_gradient_fill(ax, x, red_smooth, self.RED_DARK, self.RED_LIGHT)
-        self._draw_gradient_fill(ax, x, green_smooth, self.GREEN_DARK, self.GREEN_LIGHT)
-        self._draw_gradient_fill(ax, x, blue_smooth, self.BLUE_DARK, self.BLUE_LIGHT)
+        self._draw_gradient_fill(ax, x, red_smooth, _RED_CMAP)
+        self._draw_gradient_fill(ax, x, green_smooth, _GREEN_CMAP)
+        self._draw_gradient_fill(ax, x, blue_smooth, _BLUE_CMAP)
 
         # Clean up axes
         ax.set_xlim(0, 255)
@@ -52,7 +53,7 @@ class ElegantCurvesStyle(BaseStyle):
 
         fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
 
-        image_bytes = self._save_figure_to_bytes_transparent(fig)
+        image_bytes = self._save_figure_to_bytes(fig)
 
         return RenderResult(
             image_bytes=image_bytes,
@@ -62,11 +63,10 @@ class ElegantCurvesStyle(BaseStyle):
 
     def _draw_gradient_fill(
         self,
-        ax: plt.Axes,
+        ax: Axes,
         x: np.ndarray,
         y: np.ndarray,
-        dark_color: str,
-        light_color: str,
+        cmap: LinearSegmentedColormap,
     ):
         """
         Draw a curve with vertical gradient fill using imshow clipped to curve path.
@@ -74,48 +74,18 @@ class ElegantCurvesStyle(BaseStyle):
         Creates a gradient image from dark (bottom) to light (top) and clips it
         to the area under the curve using a polygon clip path.
         """
-        from matplotlib.patches import Polygon
-
-        # Create the gradient image (vertical gradient from dark to light)
-        gradient = np.linspace(0, 1, 256).reshape(-1, 1)
-        gradient = np.hstack([gradient] * 256)
-
-        # Create colormap from dark to light
-        cmap = LinearSegmentedColormap.from_list("gradient", [dark_color, light_color])
+        # Pre-apply the colormap so matplotlib resamples a small RGBA image
+        # instead of colormapping every output pixel at draw time
+        gradient_rgba = cmap(_GRADIENT, bytes=True)
 
         # Display the gradient image
         im = ax.imshow(
-            gradient,
+            gradient_rgba,
             aspect="auto",
             extent=[0, 255, 0, 1],
             origin="lower",
-            cmap=cmap,
             alpha=0.85,
         )
 
-        # Create clip path from the curve
-        # Build polygon: curve points + bottom corners
-        verts = list(zip(x, y))
-        verts.append((255, 0))  # Bottom right
-        verts.append((0, 0))    # Bottom left
-        poly = Polygon(verts, closed=True, transform=ax.transData)
-
         # Clip the gradient image to the curve shape
-        im.set_clip_path(poly)
-
-    def _save_figure_to_bytes_transparent(self, fig: plt.Figure) -> bytes:
-        """Save matplotlib figure to PNG bytes with alpha transparency."""
-        buf = BytesIO()
-        fig.savefig(
-            buf,
-            format="png",
-            dpi=self.dpi,
-            bbox_inches="tight",
-            pad_inches=0,
-            transparent=True,
-            facecolor="none",
-            edgecolor="none",
-        )
-        buf.seek(0)
-        plt.close(fig)
-        return buf.read()
+        self._clip_to_curve(ax, im, x, y)
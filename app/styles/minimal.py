@@ -1,12 +1,7 @@
 """Minimal histogram style - ultra-clean lines with maximum whitespace and subtle colors."""
 
-from io import BytesIO
-
-import matplotlib.pyplot as plt
-import numpy as np
-
 from app.services.histogram import HistogramData
-from app.styles.base import BaseStyle, RenderResult
+from app.styles.base import HISTOGRAM_X, BaseStyle, RenderResult
 
 
 class MinimalStyle(BaseStyle):
@@ -28,21 +23,13 @@ class MinimalStyle(BaseStyle):
     def render(self, data: HistogramData) -> RenderResult:
         """Render histogram with minimal style."""
         # Create figure with golden ratio dimensions
-        fig_width = self.width / self.dpi
-        fig_height = self.height / self.dpi
-        fig, ax = plt.subplots(figsize=(fig_width, fig_height), facecolor="none")
-        ax.set_facecolor("none")
+        fig, ax = self._create_figure()
 
         # X values (0-255 for histogram bins)
-        x = np.linspace(0, 255, 256)
+        x = HISTOGRAM_X
 
         # Smooth the histograms and normalize to use full vertical range
-        red_smooth = self.smooth_histogram(data.red)
-        green_smooth = self.smooth_histogram(data.green)
-        blue_smooth = self.smooth_histogram(data.blue)
-        red_smooth, green_smooth, blue_smooth = self.normalize_to_full_range(
-            red_smooth, green_smooth, blue_smooth
-        )
+        red_smooth, green_smooth, blue_smooth = self.smooth_and_normalize(data)
 
         # Draw clean lines - minimal style
         ax.plot(x, red_smooth, color=self.MINIMAL_RED, linewidth=3.5, alpha=0.9)
@@ -56,27 +43,10 @@ class MinimalStyle(BaseStyle):
 
         fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
 
-        image_bytes = self._save_figure_to_bytes_transparent(fig)
+        image_bytes = self._save_figure_to_bytes(fig)
 
         return RenderResult(
             image_bytes=image_bytes,
             width=self.width,
             height=self.height,
         )
-
-    def _save_figure_to_bytes_transparent(self, fig: plt.Figure) -> bytes:
-        """Save matplotlib figure to PNG bytes with alpha transparency."""
-        buf = BytesIO()
-        fig.savefig(
-            buf,
-            format="png",
-            dpi=self.dpi,
-            bbox_inches="tight",
-            pad_inches=0,
-            transparent=True,
-            facecolor="none",
-            edgecolor="none",
-        )
-        buf.seek(0)
-        plt.close(fig)
-        return buf.read()
@@ -1,12 +1,7 @@
 """Neon glow histogram style - bold vibrant channels with luminous glow effects."""
 
-from io import BytesIO
-
-import matplotlib.pyplot as plt
-import numpy as np
-
 from app.services.histogram import HistogramData
-from app.styles.base import BaseStyle, RenderResult
+from app.styles.base import HISTOGRAM_X, BaseStyle, RenderResult
 
 
 class NeonGlowStyle(BaseStyle):
@@ -28,21 +23,13 @@ class NeonGlowStyle(BaseStyle):
     def render(self, data: HistogramData) -> RenderResult:
         """Render histogram with neon glow style."""
         # Create figure with golden ratio dimensions
-        fig_width = self.width / self.dpi
-        fig_height = self.height / self.dpi
-        fig, ax = plt.subplots(figsize=(fig_width, fig_height), facecolor="none")
-        ax.set_facecolor("none")
+        fig, ax = self._create_figure()
 
         # X values (0-255 for histogram bins)
-        x = np.linspace(0, 255, 256)
+        x = HISTOGRAM_X
 
         # Smooth the histograms and normalize to use full vertical range
-        red_smooth = self.smooth_histogram(data.red)
-        green_smooth = self.smooth_histogram(data.green)
-        blue_smooth = self.smooth_histogram(data.blue)
-        red_smooth, green_smooth, blue_smooth = self.normalize_to_full_range(
-            red_smooth, green_smooth, blue_smooth
-        )
+        red_smooth, green_smooth, blue_smooth = self.smooth_and_normalize(data)
 
         # Draw glow layers (multiple passes with decreasing alpha and increasing linewidth)
         glow_layers = [
@@ -75,27 +62,10 @@ class NeonGlowStyle(BaseStyle):
 
         fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
 
-        image_bytes = self._save_figure_to_bytes_transparent(fig)
+        image_bytes = self._save_figure_to_bytes(fig)
 
         return RenderResult(
             image_bytes=image_bytes,
             width=self.width,
             height=self.height,
         )
-
-    def _save_figure_to_bytes_transparent(self, fig: plt.Figure) -> bytes:
-        """Save matplotlib figure to PNG bytes with alpha transparency."""
-        buf = BytesIO()
-        fig.savefig(
-            buf,
-            format="png",
-            dpi=self.dpi,
-            bbox_inches="tight",
-            pad_inches=0,
-            transparent=True,
-            facecolor="none",
-            edgecolor="none",
-        )
-        buf.seek(0)
-        plt.close(fig)
-        return buf.read()
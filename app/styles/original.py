@@ -1,12 +1,7 @@
 """Original histogram style - classic RGB curves with transparent background."""
 
-from io import BytesIO
-
-import matplotlib.pyplot as plt
-import numpy as np
-
 from app.services.histogram import HistogramData
-from app.styles.base import BaseStyle, RenderResult
+from app.styles.base import HISTOGRAM_X, BaseStyle, RenderResult
 
 
 class OriginalStyle(BaseStyle):
@@ -32,22 +27,13 @@ class OriginalStyle(BaseStyle):
 
     def render(self, data: HistogramData) -> RenderResult:
         """Render histogram with classic RGB style and transparent background."""
-        fig_width = self.width / self.dpi
-        fig_height = self.height / self.dpi
-
         # Create figure with transparent background
-        fig, ax = plt.subplots(figsize=(fig_width, fig_height), facecolor="none")
-        ax.set_facecolor("none")
+        fig, ax = self._create_figure()
 
-        x = np.linspace(0, 255, 256)
+        x = HISTOGRAM_X
 
         # Smooth and normalize histograms
-        red_smooth = self.smooth_histogram(data.red)
-        green_smooth = self.smooth_histogram(data.green)
-        blue_smooth = self.smooth_histogram(data.blue)
-        red_smooth, green_smooth, blue_smooth = self.normalize_to_full_range(
-            red_smooth, green_smooth, blue_smooth
-        )
+        red_smooth, green_smooth, blue_smooth = self.smooth_and_normalize(data)
 
         # Draw fills with hatch pattern (no solid fill, just hatching)
         ax.fill_between(
@@ -84,27 +70,10 @@ class OriginalStyle(BaseStyle):
 
         fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
 
-        image_bytes = self._save_figure_to_bytes_transparent(fig)
+        image_bytes = self._save_figure_to_bytes(fig)
 
         return RenderResult(
             image_bytes=image_bytes,
             width=self.width,
             height=self.height,
         )
-
-    def _save_figure_to_bytes_transparent(self, fig: plt.Figure) -> bytes:
-        """Save matplotlib figure to PNG bytes with alpha transparency."""
-        buf = BytesIO()
-        fig.savefig(
-            buf,
-            format="png",
-            dpi=self.dpi,
-            bbox_inches="tight",
-            pad_inches=0,
-            transparent=True,
-            facecolor="none",
-            edgecolor="none",
-        )
-        buf.seek(0)
-        plt.close(fig)
-        return buf.read()
@@ -1,12 +1,10 @@
 """Tron histogram style - neon curves with grid on transparent background."""
 
-from io import BytesIO
-
-import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.collections import LineCollection
 
 from app.services.histogram import HistogramData
-from app.styles.base import BaseStyle, RenderResult
+from app.styles.base import HISTOGRAM_X, BaseStyle, RenderResult
 
 
 class TronStyle(BaseStyle):
@@ -28,20 +26,12 @@ class TronStyle(BaseStyle):
 
     def render(self, data: HistogramData) -> RenderResult:
         """Render histogram with Tron style."""
-        fig_width = self.width / self.dpi
-        fig_height = self.height / self.dpi
-        fig, ax = plt.subplots(figsize=(fig_width, fig_height), facecolor="none")
-        ax.set_facecolor("none")
+        fig, ax = self._create_figure()
 
-        x = np.linspace(0, 255, 256)
+        x = HISTOGRAM_X
 
         # Smooth and normalize histograms
-        red_smooth = self.smooth_histogram(data.red)
-        green_smooth = self.smooth_histogram(data.green)
-        blue_smooth = self.smooth_histogram(data.blue)
-        red_smooth, green_smooth, blue_smooth = self.normalize_to_full_range(
-            red_smooth, green_smooth, blue_smooth
-        )
+        red_smooth, green_smooth, blue_smooth = self.smooth_and_normalize(data)
 
         # Set up axes
         ax.set_xlim(0, 255)
@@ -54,14 +44,13 @@ class TronStyle(BaseStyle):
         grid_dash = (8, 6)
         grid_color_bright = "#00FFFF"  # Bright cyan
 
-        # Grid lines (zorder=1) - rule of thirds (3x3 grid)
-        for x_pos in np.linspace(0, 255, 4)[1:-1]:  # 2 vertical lines at 1/3 and 2/3
-            ax.axvline(x=x_pos, color=grid_color_bright, alpha=0.5,
-                       linewidth=1.0, linestyle="--", dashes=grid_dash, zorder=1)
-
-        for y_pos in np.linspace(0, 1.05, 4)[1:-1]:  # 2 horizontal lines at 1/3 and 2/3
-            ax.axhline(y=y_pos, color=grid_color_bright, alpha=0.5,
-                       linewidth=1.0, linestyle="--", dashes=grid_dash, zorder=1)
+        # Grid lines (zorder=1) - rule of thirds (3x3 grid), drawn as one collection
+        x_thirds = np.linspace(0, 255, 4)[1:-1]  # 2 vertical lines at 1/3 and 2/3
+        y_thirds = np.linspace(0, 1.05, 4)[1:-1]  # 2 horizontal lines at 1/3 and 2/3
+        grid_segments = [[(x_pos, 0), (x_pos, 1.05)] for x_pos in x_thirds]
+        grid_segments += [[(0, y_pos), (255, y_pos)] for y_pos in y_thirds]
+        ax.add_collection(LineCollection(grid_segments, colors=grid_color_bright, alpha=0.5,
+                                         linewidths=1.0, linestyles=[(0, grid_dash)], zorder=1))
 
         # Border frame (zorder=5 - on top of everything)
         from matplotlib.patches import Rectangle
@@ -97,27 +86,10 @@ class TronStyle(BaseStyle):
 
         fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
 
-        image_bytes = self._save_figure_to_bytes_transparent(fig)
+        image_bytes = self._save_figure_to_bytes(fig)
 
         return RenderResult(
             image_bytes=image_bytes,
             width=self.width,
             height=self.height,
         )
-
-    def _save_figure_to_bytes_transparent(self, fig: plt.Figure) -> bytes:
-        """Save matplotlib figure to PNG bytes with alpha transparency."""
-        buf = BytesIO()
-        fig.savefig(
-            buf,
-            format="png",
-            dpi=self.dpi,
-            bbox_inches="tight",
-            pad_inches=0,
-            transparent=True,
-            facecolor="none",
-            edgecolor="none",
-        )
-        buf.seek(0)
-        plt.close(fig)
-        return buf.read()
@@ -2,25 +2,33 @@
 
 import logging
 
-import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.axes import Axes
 from matplotlib.colors import LinearSegmentedColormap
 from scipy.ndimage import gaussian_filter1d
 
+from app.core.config import settings
 from app.services.histogram import HistogramData
 from app.services.openrouter import transform_to_watercolor
-from app.styles.base import BaseStyle, RenderResult
+from app.styles.base import HISTOGRAM_X, BaseStyle, RenderResult
 from app.styles.minimal import MinimalStyle
 
 logger = logging.getLogger(__name__)
 
+# Smoothed edge noise for the watercolor bleed. It depends only on the fixed
+# seed, so it is computed once. A private RandomState reproduces the legacy
+# np.random.seed(42) sequence without touching global RNG state.
+_WATERCOLOR_NOISE = gaussian_filter1d(
+    np.random.RandomState(42).randn(256) * 0.05, sigma=3
+).astype(np.float32)
+
 
 class WatercolorStyle(BaseStyle):
     """
     Soft, organic edges mimicking watercolor paint bleeding.
 
-    Uses LLM-based image generation via OpenRouter when available,
-    falling back to matplotlib rendering otherwise.
+    Uses LLM-based image generation via OpenRouter (render_remote) when
+    available, falling back to matplotlib rendering (render) otherwise.
 
     Features:
     - Irregular/ragged top edges like paint bleeding on paper
@@ -41,25 +49,39 @@ class WatercolorStyle(BaseStyle):
     # Paper background color
     PAPER_COLOR = "#F5F5DC"  # Beige/cream
 
-    def render(self, data: HistogramData) -> RenderResult:
-        """Render histogram with watercolor style."""
-        # Try LLM-based generation first
-        llm_result = self._try_llm_generation(data)
-        if llm_result:
-            return llm_result
+    # Paper margin around the plot in points, as tight_layout(pad=0.5) leaves
+    # around an axis-less plot at the default 10 pt font size
+    PAPER_MARGIN_PT = 5
+
+    # Gradient colormaps (paper to dark to light), built once with the class
+    RED_CMAP = LinearSegmentedColormap.from_list("red", [PAPER_COLOR, RED_DARK, RED_LIGHT])
+    GREEN_CMAP = LinearSegmentedColormap.from_list("green", [PAPER_COLOR, GREEN_DARK, GREEN_LIGHT])
+    BLUE_CMAP = LinearSegmentedColormap.from_list("blue", [PAPER_COLOR, BLUE_DARK, BLUE_LIGHT])
 
-        # Fall back to matplotlib rendering
+    # The LLM transform is a network round-trip; see BaseStyle.render_remote()
+    REMOTE_RENDER = True
+
+    def render(self, data: HistogramData) -> RenderResult:
+        """Render histogram with watercolor style using matplotlib."""
         return self._render_matplotlib(data)
 
-    def _try_llm_generation(self, data: HistogramData) -> RenderResult | None:
-        """Attempt to generate watercolor image via OpenRouter img2img."""
+    def remote_input(self, data: HistogramData) -> bytes | None:
+        """Render the minimal histogram as the img2img reference for OpenRouter."""
+        # Without an API key the reference render would be encoded for nothing
+        if not settings.openrouter_api_key:
+            return None
+
         try:
-            # First, render the minimal histogram as the input reference
             minimal = MinimalStyle(width=self.width, smoothing=self.smoothing)
-            minimal_result = minimal.render(data)
+            return minimal.render(data).image_bytes
+        except Exception as e:
+            logger.warning(f"LLM reference render failed: {e}")
+        return None
 
-            # Transform it to watercolor style
-            image_bytes = transform_to_watercolor(minimal_result.image_bytes)
+    def render_remote(self, input_bytes: bytes) -> RenderResult | None:
+        """Transform the reference histogram to watercolor via OpenRouter img2img."""
+        try:
+            image_bytes = transform_to_watercolor(input_bytes)
             if image_bytes:
                 logger.info("Transformed histogram to watercolor via OpenRouter")
                 return RenderResult(
@@ -73,48 +95,33 @@ class WatercolorStyle(BaseStyle):
 
     def _render_matplotlib(self, data: HistogramData) -> RenderResult:
         """Render histogram using matplotlib (fallback)."""
-        fig_width = self.width / self.dpi
-        fig_height = self.height / self.dpi
-        fig, ax = plt.subplots(figsize=(fig_width, fig_height), facecolor=self.PAPER_COLOR)
-        ax.set_facecolor(self.PAPER_COLOR)
-
-        x = np.linspace(0, 255, 256)
-
-        # Smooth the histograms
-        red_smooth = self.smooth_histogram(data.red)
-        green_smooth = self.smooth_histogram(data.green)
-        blue_smooth = self.smooth_histogram(data.blue)
-        red_smooth, green_smooth, blue_smooth = self.normalize_to_full_range(
-            red_smooth, green_smooth, blue_smooth
-        )
+        fig, ax = self._create_figure(facecolor=self.PAPER_COLOR)
+
+        x = HISTOGRAM_X
+
+        # Smooth the histograms and normalize to use full vertical range
+        red_smooth, green_smooth, blue_smooth = self.smooth_and_normalize(data)
 
         # Add irregular edges to simulate watercolor bleeding
         red_watercolor = self._add_watercolor_edge(red_smooth)
         green_watercolor = self._add_watercolor_edge(green_smooth)
         blue_watercolor = self._add_watercolor_edge(blue_smooth)
 
-        # Create gradient colormaps
-        red_cmap = LinearSegmentedColormap.from_list(
-            "red", [self.PAPER_COLOR, self.RED_DARK, self.RED_LIGHT]
-        )
-        green_cmap = LinearSegmentedColormap.from_list(
-            "green", [self.PAPER_COLOR, self.GREEN_DARK, self.GREEN_LIGHT]
-        )
-        blue_cmap = LinearSegmentedColormap.from_list(
-            "blue", [self.PAPER_COLOR, self.BLUE_DARK, self.BLUE_LIGHT]
-        )
-
         # Draw watercolor fills with soft blending
-        self._draw_watercolor_fill(ax, x, red_watercolor, red_cmap, alpha=0.7)
-        self._draw_watercolor_fill(ax, x, green_watercolor, green_cmap, alpha=0.7)
-        self._draw_watercolor_fill(ax, x, blue_watercolor, blue_cmap, alpha=0.7)
+        self._draw_watercolor_fill(ax, x, red_watercolor, self.RED_CMAP, alpha=0.7)
+        self._draw_watercolor_fill(ax, x, green_watercolor, self.GREEN_CMAP, alpha=0.7)
+        self._draw_watercolor_fill(ax, x, blue_watercolor, self.BLUE_CMAP, alpha=0.7)
 
         # Clean up axes
         ax.set_xlim(0, 255)
         ax.set_ylim(0, 1.05)
         ax.axis("off")
 
-        fig.tight_layout(pad=0.5)
+        # Inset the plot by the paper margin directly instead of running a
+        # tight_layout pass over the figure
+        margin_x = self.PAPER_MARGIN_PT / 72 * self.dpi / self.width
+        margin_y = self.PAPER_MARGIN_PT / 72 * self.dpi / self.height
+        fig.subplots_adjust(left=margin_x, right=1 - margin_x, bottom=margin_y, top=1 - margin_y)
 
         image_bytes = self._save_figure_to_bytes(fig)
 
@@ -126,24 +133,12 @@ class WatercolorStyle(BaseStyle):
 
     def _add_watercolor_edge(self, hist: np.ndarray) -> np.ndarray:
         """Add irregular edges to histogram to simulate watercolor bleeding."""
-        # Create random variations for the edge
-        np.random.seed(42)  # Consistent results
-        noise = np.random.randn(len(hist)) * 0.05
-
-        # Smooth the noise so variations are gradual
-        noise_smooth = gaussian_filter1d(noise, sigma=3)
-
-        # Apply noise to the histogram values
-        result = hist + noise_smooth * hist
-
-        # Ensure values stay in valid range
-        result = np.clip(result, 0, 1)
-
-        return result
+        # Apply the precomputed noise and keep values in valid range
+        return np.clip(hist + _WATERCOLOR_NOISE * hist, 0.0, 1.0)
 
     def _draw_watercolor_fill(
         self,
-        ax: plt.Axes,
+        ax: Axes,
         x: np.ndarray,
         y: np.ndarray,
         cmap: LinearSegmentedColormap,
@@ -154,29 +149,26 @@ class WatercolorStyle(BaseStyle):
 
         Creates the effect of paint pooling darker at the bottom
         and lighter/more saturated at the top.
+
+        The layered washes are built as one RGBA image with a horizontal band
+        per layer, drawn with a single imshow clipped to the curve.
         """
         n_layers = 50
 
-        for i in range(n_layers):
-            # Calculate the y range for this layer
-            y_bottom = i / n_layers
-            y_top = (i + 1) / n_layers
-
-            # Get color for this height - darker at bottom, lighter at top
-            color = cmap(0.3 + 0.7 * (i / n_layers))
-
-            # Create the fill with soft edges
-            y_fill = np.clip(y, y_bottom, y_top)
-
-            ax.fill_between(
-                x,
-                y_bottom,
-                y_fill,
-                where=(y >= y_bottom),
-                color=color,
-                alpha=alpha / n_layers * 2.5,
-                linewidth=0,
-            )
+        # Color for each layer height - darker at bottom, lighter at top.
+        # uint8 RGBA keeps imshow on its fast integer resampling path.
+        layers = cmap(0.3 + 0.7 * (np.arange(n_layers) / n_layers), bytes=True)
+        layers = layers.reshape(n_layers, 1, 4)
+        layers[..., 3] = round(alpha / n_layers * 2.5 * 255)
+
+        im = ax.imshow(
+            layers,
+            aspect="auto",
+            extent=[0, 255, 0, 1],
+            origin="lower",
+            interpolation="nearest",
+        )
+        self._clip_to_curve(ax, im, x, y)
 
         # Add a very subtle darker edge at the top for definition
         ax.fill_between(
@@ -0,0 +1,15 @@
+"""Shared pytest fixtures."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create test client shared by the session, running lifespan events once."""
+    with TestClient(app) as test_client:
+        # Warm up once so lazy initialization isn't charged to the first test
+        test_client.get("/health")
+        yield test_client
@@ -1,44 +1,52 @@
 """Tests for the histogram API endpoint."""
 
-import base64
+import binascii
+import struct
 from io import BytesIO
 
+import numpy as np
 import pytest
-from fastapi.testclient import TestClient
 from PIL import Image
 
-from app.main import app
+from app.api.v1 import histogram as histogram_api
+from app.core.config import settings
+from app.styles import watercolor
 
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
 
+def parse_image_response(data: dict) -> tuple[bytes, tuple[int, int]]:
+    """Decode a response image once and read its size from the PNG IHDR chunk."""
+    image_bytes = binascii.a2b_base64(data["image"])
+    assert image_bytes[:8] == PNG_SIGNATURE
+    # IHDR is always the first chunk, right after the signature
+    assert image_bytes[12:16] == b"IHDR"
+    return image_bytes, struct.unpack(">II", image_bytes[16:24])
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def test_image_bytes():
     """Create a test image."""
     img = Image.new("RGB", (100, 100), (255, 128, 64))
     buf = BytesIO()
     img.save(buf, format="PNG")
-    buf.seek(0)
-    return buf.read()
+    return buf.getvalue()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def large_test_image_bytes():
     """Create a larger test image for realistic testing."""
-    img = Image.new("RGB", (800, 600))
-    # Create a gradient
-    pixels = img.load()
-    for x in range(800):
-        for y in range(600):
-            pixels[x, y] = (x % 256, y % 256, (x + y) % 256)
+    # Create a gradient: (x % 256, y % 256, (x + y) % 256) per pixel
+    x = np.arange(800, dtype=np.uint16)
+    y = np.arange(600, dtype=np.uint16)
+    red = np.broadcast_to(x & 0xFF, (600, 800))
+    green = np.broadcast_to((y & 0xFF)[:, None], (600, 800))
+    blue = (x[None, :] + y[:, None]) & 0xFF
+    pixels = np.stack([red, green, blue], axis=-1).astype(np.uint8)
+    img = Image.fromarray(pixels, "RGB")
     buf = BytesIO()
     img.save(buf, format="PNG")
-    buf.seek(0)
-    return buf.read()
+    return buf.getvalue()
 
 
 class TestHealthEndpoint:
@@ -76,13 +84,25 @@ class TestHistogramEndpoint:
         assert "dominant_colors" in data["metadata"]
         assert "processing_time_ms" in data["metadata"]
 
-        # Verify base64 image is valid
-        image_bytes = base64.b64decode(data["image"])
-        assert len(image_bytes) > 0
+        # Verify base64 image is a PNG whose dimensions match the metadata
+        _, size = parse_image_response(data)
+        assert size == (data["metadata"]["width"], data["metadata"]["height"])
+
+    def test_histogram_image_decodes(self, client, test_image_bytes):
+        """Test that the returned image fully decodes as a PNG of the reported size."""
+        response = client.post(
+            "/api/v1/histogram",
+            files={"image": ("test.png", test_image_bytes, "image/png")},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
 
-        # Verify it's a valid PNG
+        image_bytes, _ = parse_image_response(data)
         img = Image.open(BytesIO(image_bytes))
+        img.load()
         assert img.format == "PNG"
+        assert img.size == (data["metadata"]["width"], data["metadata"]["height"])
 
     def test_histogram_with_style(self, client, test_image_bytes):
         """Test histogram generation with specific style."""
@@ -105,6 +125,8 @@ class TestHistogramEndpoint:
         assert response.status_code == 200
         data = response.json()
         assert data["metadata"]["width"] == 800
+        _, (width, _) = parse_image_response(data)
+        assert width == 800
 
     def test_histogram_with_smoothing(self, client, test_image_bytes):
         """Test histogram generation with custom smoothing."""
@@ -117,79 +139,112 @@ class TestHistogramEndpoint:
         assert response.status_code == 200
 
 
-class TestErrorHandling:
-    """Tests for error handling."""
+class TestRemoteRendering:
+    """Tests for styles rendered through OpenRouter."""
 
-    def test_invalid_image_format(self, client):
-        """Test rejection of invalid image format."""
-        response = client.post(
-            "/api/v1/histogram",
-            files={"image": ("test.txt", b"not an image", "text/plain")},
-        )
+    def test_watercolor_uses_remote_render(self, client, test_image_bytes, monkeypatch):
+        """Test that the transformed image is returned without holding a render slot."""
+        borrowed = []
 
-        assert response.status_code == 400
-        data = response.json()
-        assert data["detail"]["error"] == "INVALID_IMAGE"
+        def fake_transform(input_image_bytes):
+            borrowed.append(histogram_api._render_limiter.borrowed_tokens)
+            assert input_image_bytes[:8] == PNG_SIGNATURE
+            return b"transformed"
 
-    def test_invalid_style(self, client, test_image_bytes):
-        """Test rejection of invalid style."""
+        monkeypatch.setattr(settings, "openrouter_api_key", "test-key")
+        monkeypatch.setattr(watercolor, "transform_to_watercolor", fake_transform)
         response = client.post(
             "/api/v1/histogram",
             files={"image": ("test.png", test_image_bytes, "image/png")},
-            data={"style": "nonexistent_style"},
+            data={"style": "watercolor"},
         )
 
-        assert response.status_code == 400
-        data = response.json()
-        assert data["detail"]["error"] == "INVALID_STYLE"
+        assert response.status_code == 200
+        assert binascii.a2b_base64(response.json()["image"]) == b"transformed"
+        assert borrowed == [0]
 
-    def test_invalid_width_too_small(self, client, test_image_bytes):
-        """Test rejection of width below minimum."""
+    def test_watercolor_falls_back_to_local_render(self, client, test_image_bytes, monkeypatch):
+        """Test that a failed remote render falls back to matplotlib."""
+        monkeypatch.setattr(settings, "openrouter_api_key", "test-key")
+        monkeypatch.setattr(watercolor, "transform_to_watercolor", lambda _: None)
         response = client.post(
             "/api/v1/histogram",
             files={"image": ("test.png", test_image_bytes, "image/png")},
-            data={"width": 50},
+            data={"style": "watercolor"},
         )
 
-        assert response.status_code == 400
+        assert response.status_code == 200
         data = response.json()
-        assert data["detail"]["error"] == "INVALID_WIDTH"
+        _, size = parse_image_response(data)
+        assert size == (data["metadata"]["width"], data["metadata"]["height"])
+
+
+class TestErrorHandling:
+    """Tests for error handling."""
 
-    def test_invalid_width_too_large(self, client, test_image_bytes):
-        """Test rejection of width above maximum."""
+    def test_invalid_image_format(self, client):
+        """Test rejection of invalid image format."""
         response = client.post(
             "/api/v1/histogram",
-            files={"image": ("test.png", test_image_bytes, "image/png")},
-            data={"width": 10000},
+            files={"image": ("test.txt", b"not an image", "text/plain")},
         )
 
         assert response.status_code == 400
         data = response.json()
-        assert data["detail"]["error"] == "INVALID_WIDTH"
+        assert data["detail"]["error"] == "INVALID_IMAGE"
 
-    def test_invalid_smoothing_negative(self, client, test_image_bytes):
-        """Test rejection of negative smoothing value."""
+    @pytest.mark.parametrize(
+        ("form_data", "expected_error"),
+        [
+            ({"style": "nonexistent_style"}, "INVALID_STYLE"),
+            ({"width": 50}, "INVALID_WIDTH"),
+            ({"width": 10000}, "INVALID_WIDTH"),
+            ({"smoothing": -0.5}, "INVALID_SMOOTHING"),
+            ({"smoothing": 1.5}, "INVALID_SMOOTHING"),
+        ],
+        ids=[
+            "style_unknown",
+            "width_too_small",
+            "width_too_large",
+            "smoothing_negative",
+            "smoothing_too_high",
+        ],
+    )
+    def test_invalid_parameter(self, client, test_image_bytes, form_data, expected_error):
+        """Test rejection of out-of-range or unknown form parameters."""
         response = client.post(
             "/api/v1/histogram",
             files={"image": ("test.png", test_image_bytes, "image/png")},
-            data={"smoothing": -0.5},
+            data=form_data,
         )
 
         assert response.status_code == 400
         data = response.json()
-        assert data["detail"]["error"] == "INVALID_SMOOTHING"
-
-    def test_invalid_smoothing_too_high(self, client, test_image_bytes):
-        """Test rejection of smoothing value above 1.0."""
+        assert data["detail"]["error"] == expected_error
+
+    @pytest.mark.parametrize(
+        ("with_image", "form_data"),
+        [(False, {"width": 50}), (True, {"width": "abc"})],
+        ids=["missing_image", "width_not_integer"],
+    )
+    def test_other_validation_errors(self, client, test_image_bytes, with_image, form_data):
+        """Test that errors other than out-of-range fields keep the default 422."""
+        files = {"image": ("test.png", test_image_bytes, "image/png")} if with_image else None
+        response = client.post("/api/v1/histogram", files=files, data=form_data)
+
+        assert response.status_code == 422
+
+    def test_image_too_large(self, client, test_image_bytes, monkeypatch):
+        """Test rejection of image above maximum file size."""
+        monkeypatch.setattr(histogram_api, "MAX_UPLOAD_BYTES", 0)
         response = client.post(
             "/api/v1/histogram",
             files={"image": ("test.png", test_image_bytes, "image/png")},
-            data={"smoothing": 1.5},
         )
 
-        assert response.status_code == 400
+        assert response.status_code == 413
         data = response.json()
-        assert data["detail"]["error"] == "INVALID_SMOOTHING"
+        assert data["detail"]["error"] == "IMAGE_TOO_LARGE"
 
 
 class TestDominantColors:
@@ -207,4 +262,4 @@ class TestDominantColors:
 
         dominant_colors = data["metadata"]["dominant_colors"]
         assert len(dominant_colors) > 0
-        assert all(c.startswith("#") for c in dominant_colors)
+        assert np.char.startswith(np.array(dominant_colors), "#").all()
@@ -1,67 +1,72 @@
 """Tests for histogram calculation service."""
 
 import numpy as np
+import pytest
 from PIL import Image
 from io import BytesIO
 
-from app.services.histogram import calculate_histogram, extract_dominant_colors
+from app.services import histogram
+from app.services.histogram import (
+    calculate_histogram,
+    calculate_histogram_array,
+    extract_dominant_colors,
+)
+
+
+def create_test_array(
+    color: tuple[int, int, int], size: tuple[int, int] = (100, 100)
+) -> np.ndarray:
+    """Create a solid color test pixel array, skipping the encode/decode round-trip."""
+    return np.full((size[1], size[0], 3), color, dtype=np.uint8)
 
 
 def create_test_image(color: tuple[int, int, int], size: tuple[int, int] = (100, 100)) -> bytes:
-    """Create a solid color test image."""
-    img = Image.new("RGB", size, color)
-    buf = BytesIO()
-    img.save(buf, format="PNG")
-    buf.seek(0)
-    return buf.read()
+    """Create a solid color test image as binary PPM (P6), without going through PIL."""
+    width, height = size
+    header = f"P6\n{width} {height}\n255\n".encode("ascii")
+    return header + bytes(color) * (width * height)
 
 
 def create_gradient_image(size: tuple[int, int] = (256, 100)) -> bytes:
     """Create a horizontal gradient test image."""
-    img = Image.new("RGB", size)
-    pixels = img.load()
-    for x in range(size[0]):
-        for y in range(size[1]):
-            pixels[x, y] = (x, x, x)  # Grayscale gradient
+    # Grayscale gradient: every row is 0..width-1 in all three channels
+    row = np.arange(size[0], dtype=np.uint8)
+    pixels = np.broadcast_to(row[None, :, None], (size[1], size[0], 3)).copy()
+    img = Image.fromarray(pixels, "RGB")
     buf = BytesIO()
-    img.save(buf, format="PNG")
-    buf.seek(0)
-    return buf.read()
+    img.save(buf, format="BMP")
+    return buf.getvalue()
 
 
-class TestHistogramCalculation:
-    """Tests for histogram calculation."""
+SOLID_COLORS = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (128, 128, 128)]
 
-    def test_solid_red_image(self):
-        """Test histogram of solid red image."""
-        image_bytes = create_test_image((255, 0, 0))
-        result = calculate_histogram(image_bytes)
-
-        # Red channel should have all values at 255
-        assert result.red[255] == 1.0
-        assert np.sum(result.red[:255]) == 0.0
 
-        # Green and blue should have all values at 0
-        assert result.green[0] == 1.0
-        assert result.blue[0] == 1.0
+@pytest.fixture(scope="session")
+def solid_images() -> dict[tuple[int, int, int], np.ndarray]:
+    """Solid color test arrays, built once per session."""
+    return {color: create_test_array(color) for color in SOLID_COLORS}
 
-    def test_solid_green_image(self):
-        """Test histogram of solid green image."""
-        image_bytes = create_test_image((0, 255, 0))
-        result = calculate_histogram(image_bytes)
 
-        assert result.green[255] == 1.0
-        assert result.red[0] == 1.0
-        assert result.blue[0] == 1.0
-
-    def test_solid_blue_image(self):
-        """Test histogram of solid blue image."""
-        image_bytes = create_test_image((0, 0, 255))
-        result = calculate_histogram(image_bytes)
+class TestHistogramCalculation:
+    """Tests for histogram calculation."""
 
-        assert result.blue[255] == 1.0
-        assert result.red[0] == 1.0
-        assert result.green[0] == 1.0
+    @pytest.mark.parametrize(
+        ("color", "channel"),
+        [((255, 0, 0), "red"), ((0, 255, 0), "green"), ((0, 0, 255), "blue")],
+    )
+    def test_solid_primary_image(self, solid_images, color, channel):
+        """Test histogram of solid red, green and blue images."""
+        result = calculate_histogram_array(solid_images[color])
+
+        for name in ("red", "green", "blue"):
+            hist = getattr(result, name)
+            if name == channel:
+                # Lit channel should have all values at 255
+                assert hist[255] == 1.0
+                assert not hist[:255].any()
+            else:
+                # Other channels should have all values at 0
+                assert hist[0] == 1.0
 
     def test_gradient_image(self):
         """Test histogram of gradient image has distributed values."""
@@ -69,9 +74,9 @@ class TestHistogramCalculation:
         result = calculate_histogram(image_bytes)
 
         # Should have non-zero values across the histogram
-        assert np.sum(result.red > 0) > 100
-        assert np.sum(result.green > 0) > 100
-        assert np.sum(result.blue > 0) > 100
+        assert np.count_nonzero(result.red) > 100
+        assert np.count_nonzero(result.green) > 100
+        assert np.count_nonzero(result.blue) > 100
 
     def test_dominant_colors_solid(self):
         """Test dominant color extraction from solid image."""
@@ -83,19 +88,17 @@ class TestHistogramCalculation:
         # The dominant color should be close to red (quantized)
         assert result.dominant_colors[0].startswith("#F")
 
-    def test_histogram_shape(self):
+    def test_histogram_shape(self, solid_images):
         """Test that histograms have correct shape."""
-        image_bytes = create_test_image((128, 128, 128))
-        result = calculate_histogram(image_bytes)
+        result = calculate_histogram_array(solid_images[(128, 128, 128)])
 
         assert result.red.shape == (256,)
         assert result.green.shape == (256,)
         assert result.blue.shape == (256,)
 
-    def test_histogram_normalized(self):
+    def test_histogram_normalized(self, solid_images):
         """Test that histograms are normalized to 0-1 range."""
-        image_bytes = create_test_image((128, 128, 128))
-        result = calculate_histogram(image_bytes)
+        result = calculate_histogram_array(solid_images[(128, 128, 128)])
 
         assert result.red.max() <= 1.0
         assert result.green.max() <= 1.0
@@ -104,6 +107,43 @@ class TestHistogramCalculation:
         assert result.green.min() >= 0.0
         assert result.blue.min() >= 0.0
 
+    def test_large_image_sampled(self, monkeypatch):
+        """Test that large images are point-sampled and keep the full histogram shape."""
+        # 4x4 blocks of random colors: a stride-2 point sample hits every block
+        # equally often, so the sampled counts stay proportional to the full ones
+        rng = np.random.default_rng(0)
+        blocks = rng.integers(0, 256, (25, 25, 3), dtype=np.uint8)
+        pixels = np.repeat(np.repeat(blocks, 4, axis=0), 4, axis=1)
+        full = calculate_histogram_array(pixels)
+
+        resample_filters = []
+        resize = Image.Image.resize
+
+        def spy_resize(image, size, resample=None, *args, **kwargs):
+            resample_filters.append(resample)
+            return resize(image, size, resample, *args, **kwargs)
+
+        monkeypatch.setattr(Image.Image, "resize", spy_resize)
+        monkeypatch.setattr(histogram, "HISTOGRAM_SAMPLE_PIXELS", 2500)
+        sampled = calculate_histogram_array(pixels)
+
+        assert Image.Resampling.NEAREST in resample_filters
+        for channel in ("red", "green", "blue"):
+            np.testing.assert_allclose(
+                getattr(sampled, channel), getattr(full, channel), atol=1e-6
+            )
+
+    def test_array_matches_bytes(self):
+        """Test that the array entry point matches decoding the same pixels."""
+        from_bytes = calculate_histogram(create_gradient_image())
+        pixels = np.asarray(Image.open(BytesIO(create_gradient_image())))
+        from_array = calculate_histogram_array(pixels)
+
+        np.testing.assert_array_equal(from_array.red, from_bytes.red)
+        np.testing.assert_array_equal(from_array.green, from_bytes.green)
+        np.testing.assert_array_equal(from_array.blue, from_bytes.blue)
+        assert from_array.dominant_colors == from_bytes.dominant_colors
+
 
 class TestDominantColors:
     """Tests for dominant color extraction."""
@@ -119,6 +159,6 @@ class TestDominantColors:
         img = np.full((100, 100, 3), 128, dtype=np.uint8)
         colors = extract_dominant_colors(img, n_colors=3)
 
-        for color in colors:
-            assert color.startswith("#")
-            assert len(color) == 7  # #RRGGBB format
+        hex_colors = np.array(colors)
+        assert np.char.startswith(hex_colors, "#").all()
+        assert (np.char.str_len(hex_colors) == 7).all()  # #RRGGBB format
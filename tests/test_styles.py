@@ -0,0 +1,70 @@
+"""Tests for the style renderers."""
+
+import numpy as np
+import pytest
+
+from app.services.histogram import calculate_histogram_array
+from app.services.renderer import STYLE_REGISTRY
+from app.styles import base
+from app.styles.elegant_curves import ElegantCurvesStyle
+
+
+@pytest.fixture(scope="session")
+def histograms():
+    """Histograms of a few random images with different channel shapes."""
+    rng = np.random.default_rng(0)
+    return [
+        calculate_histogram_array(
+            rng.normal(mean, 40, (64, 64, 3)).clip(0, 255).astype(np.uint8)
+        )
+        for mean in ((60, 128, 200), (200, 60, 128), (128, 200, 60))
+    ]
+
+
+def render_unpooled(style, data) -> bytes:
+    """Render on a freshly created figure, with this thread's pool emptied."""
+    base._idle_figures().clear()
+    image_bytes = style.render(data).image_bytes
+    base._idle_figures().clear()
+    return image_bytes
+
+
+class TestFigurePool:
+    """Tests for rendering on figures reused from the per-thread pool."""
+
+    def test_pooled_renders_match_fresh_figures(self, histograms):
+        """Test that repeated renders on pooled figures match fresh ones."""
+        cases = [
+            (ElegantCurvesStyle(width=width, smoothing=smoothing), data)
+            for width in (400, 600)
+            for smoothing in (0.0, 0.5)
+            for data in histograms
+        ]
+        expected = [render_unpooled(style, data) for style, data in cases]
+
+        base._idle_figures().clear()
+        for _ in range(5):
+            for (style, data), image_bytes in zip(cases, expected):
+                assert style.render(data).image_bytes == image_bytes
+
+    @pytest.mark.parametrize("style_name", list(STYLE_REGISTRY))
+    def test_every_style_matches_fresh_figures(self, histograms, style_name):
+        """Test that each style renders the same on pooled and fresh figures."""
+        style = STYLE_REGISTRY[style_name](width=400, smoothing=0.5)
+        expected = [render_unpooled(style, data) for data in histograms]
+
+        base._idle_figures().clear()
+        for _ in range(2):
+            for data, image_bytes in zip(histograms, expected):
+                assert style.render(data).image_bytes == image_bytes
+
+    def test_released_figures_hold_no_renderer(self, histograms):
+        """Test that idle figures keep no Agg renderer from their last draw."""
+        base._idle_figures().clear()
+        for aspect_ratio in (1.0, 1.618):
+            ElegantCurvesStyle(width=400, aspect_ratio=aspect_ratio).render(histograms[0])
+
+        figures = base._idle_figures()
+        assert len(figures) == 2
+        for fig in figures.values():
+            assert not hasattr(fig.canvas, "renderer")